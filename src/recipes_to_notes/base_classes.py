@@ -5,6 +5,8 @@ from langchain_core.documents.base import Document
 from langchain_core.language_models.chat_models import BaseChatModel
 from recipes_to_notes.schema import Recipe
 
+__all__ = ["BaseScraper", "BaseSchemaExtractionProvider", "BaseNotesApp"]
+
 
 class BaseScraper:
     """Abstract base class for web scraping implementations.
@@ -25,6 +27,12 @@ class BaseScraper:
         """
         raise NotImplementedError("This method should be implemented by the subclass")
 
+    async def aclose(self) -> None:
+        """Release resources held by the scraper, such as HTTP connection pools.
+
+        The default implementation does nothing.
+        """
+
 
 class BaseSchemaExtractionProvider:
     """Abstract base class for schema extraction providers.
@@ -58,3 +66,44 @@ class BaseNotesApp:
             recipe (Recipe): The Recipe object containing the extracted recipe data.
         """
         raise NotImplementedError("This method should be implemented by the subclass")
+
+    async def connect(self) -> None:
+        """Prepare the connection to the target notes application, e.g. resolve the target location.
+
+        Called by the runner concurrently with scraping, so any setup requests don't add
+        to the latency of note creation. The default implementation does nothing.
+        """
+
+    async def prefetch(self) -> None:
+        """Prepare for creating multiple notes, e.g. load existing notes in bulk.
+
+        Called by the runner once before processing multiple URLs, concurrently with scraping,
+        so notes don't need to be looked up one by one. The default implementation does nothing.
+        """
+
+    async def create_notes(self, recipes: list[Recipe]) -> list:
+        """Create notes from multiple recipes in the target notes application.
+
+        The default implementation creates notes one by one. A failure to create a note
+        does not stop processing of the remaining recipes.
+
+        Args:
+            recipes (list[Recipe]): The Recipe objects containing the extracted recipe data.
+
+        Returns:
+            list: Results of create_note for each recipe, in the same order. Recipes that
+                failed are represented by the raised exception.
+        """
+        results = []
+        for recipe in recipes:
+            try:
+                results.append(await self.create_note(recipe))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def aclose(self) -> None:
+        """Release resources held by the notes app, such as HTTP connection pools.
+
+        The default implementation does nothing.
+        """
@@ -0,0 +1,195 @@
+from recipes_to_notes.schema import Recipe
+from langchain_core.documents.base import Document
+from pydantic import ValidationError
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Default directory of the cache, following the XDG base directory specification
+DEFAULT_CACHE_DIR: Path = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "recipes_to_notes"
+# Default time after which cached entries expire, in seconds (1 week)
+DEFAULT_TTL: int = 7 * 24 * 60 * 60
+
+
+class RecipeCache:
+    """Persistent cache of scraped documents and extracted recipes.
+
+    Scraping and schema extraction are the slowest and most expensive steps of the
+    pipeline, so their results are stored on disk and reused when the same URL is
+    processed again, e.g. when retrying a failed run or updating notes.
+    Each entry is stored as a JSON file named after the SHA-256 hash of its key.
+    URLs are normalized before use in keys, so e.g. a URL with a fragment or query
+    parameters in a different order shares entries with the original URL.
+
+    Attributes:
+        cache_dir (Path): The directory the cache entries are stored in.
+        ttl (int): Time in seconds after which cached entries expire.
+    """
+    cache_dir: Path
+    ttl: int
+
+    def __init__(self, cache_dir: str | Path = DEFAULT_CACHE_DIR, ttl: int = DEFAULT_TTL) -> None:
+        """Initialize the cache, creating the cache directory if it doesn't exist.
+
+        Args:
+            cache_dir (str | Path): The directory to store the cache entries in.
+            ttl (int): Time in seconds after which cached entries expire.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def _path(self, namespace: str, key: str) -> Path:
+        """Get the path of the file storing a cache entry.
+
+        Args:
+            namespace (str): The kind of the cached entry, e.g. "documents" or "recipe".
+            key (str): The key of the cached entry.
+
+        Returns:
+            Path: The path of the cache entry file.
+        """
+        return self.cache_dir / f"{namespace}-{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _get(self, namespace: str, key: str) -> Optional[Any]:
+        """Read a cache entry.
+
+        Args:
+            namespace (str): The kind of the cached entry.
+            key (str): The key of the cached entry.
+
+        Returns:
+            Optional[Any]: The cached value, or None if there is no valid entry for the key.
+        """
+        path = self._path(namespace, key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to read cache entry %s: %s", path, e)
+            return None
+
+    def _set(self, namespace: str, key: str, value: Any) -> None:
+        """Write a cache entry.
+
+        The entry is written to a temporary file first and then moved in place,
+        so concurrent readers never see a partially written entry.
+
+        Args:
+            namespace (str): The kind of the cached entry.
+            key (str): The key of the cached entry.
+            value (Any): The JSON-serializable value to cache.
+        """
+        path = self._path(namespace, key)
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            temp_path.write_text(json.dumps(value))
+            os.replace(temp_path, path)
+        except (OSError, TypeError) as e:
+            logger.warning("Failed to write cache entry %s: %s", path, e)
+            temp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Normalize a URL, so different spellings of the same page share cache entries.
+
+        Scheme and host are lowercased, query parameters are sorted and the fragment
+        is removed, as it doesn't change the page content.
+
+        Args:
+            url (str): The URL to normalize.
+
+        Returns:
+            str: The normalized URL.
+        """
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+    @staticmethod
+    def _recipe_key(url: str, documents: list[Document]) -> str:
+        """Build the key of an extracted recipe, so it changes along with the scraped content.
+
+        Args:
+            url (str): The URL of the recipe website.
+            documents (list[Document]): The documents the recipe was extracted from.
+
+        Returns:
+            str: The cache key of the recipe.
+        """
+        return "\n".join([RecipeCache._normalize_url(url), *(document.page_content for document in documents)])
+
+    def get_documents(self, url: str) -> Optional[list[Document]]:
+        """Get the cached documents scraped from a URL.
+
+        Args:
+            url (str): The URL of the recipe website.
+
+        Returns:
+            Optional[list[Document]]: The cached documents, or None if not cached, expired or empty.
+        """
+        cached = self._get("documents", self._normalize_url(url))
+        # An empty entry comes from a failed scrape, so the URL should be scraped again
+        if not cached:
+            return None
+        try:
+            return [
+                Document(page_content=document["page_content"], metadata=document["metadata"]) for document in cached
+            ]
+        except (KeyError, TypeError, ValidationError) as e:
+            logger.warning("Ignoring malformed cached documents of %s: %s", url, e)
+            return None
+
+    def set_documents(self, url: str, documents: list[Document]) -> None:
+        """Cache the documents scraped from a URL.
+
+        Args:
+            url (str): The URL of the recipe website.
+            documents (list[Document]): The scraped documents.
+        """
+        self._set(
+            "documents",
+            self._normalize_url(url),
+            [{"page_content": document.page_content, "metadata": document.metadata} for document in documents]
+        )
+
+    def get_recipe(self, url: str, documents: list[Document]) -> Optional[Recipe]:
+        """Get the cached recipe extracted from the documents scraped from a URL.
+
+        Args:
+            url (str): The URL of the recipe website.
+            documents (list[Document]): The documents the recipe was extracted from.
+
+        Returns:
+            Optional[Recipe]: The cached recipe, or None if not cached or expired.
+        """
+        cached = self._get("recipe", self._recipe_key(url, documents))
+        if cached is None:
+            return None
+        try:
+            return Recipe.model_validate(cached)
+        except ValidationError as e:
+            # Entries cached before a change of the Recipe schema no longer validate
+            logger.warning("Ignoring malformed cached recipe of %s: %s", url, e)
+            return None
+
+    def set_recipe(self, url: str, documents: list[Document], recipe: Recipe) -> None:
+        """Cache the recipe extracted from the documents scraped from a URL.
+
+        Args:
+            url (str): The URL of the recipe website.
+            documents (list[Document]): The documents the recipe was extracted from.
+            recipe (Recipe): The extracted recipe.
+        """
+        self._set("recipe", self._recipe_key(url, documents), recipe.model_dump())
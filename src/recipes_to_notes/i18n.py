@@ -1,17 +1,17 @@
-"""Internationalization constants for the recipes-to-notes package."""
+"""Internationalization constants for the recipes-to-notes package.
 
+Attributes:
+    NOTES_LABELS (Dict[str, Dict[str, str]]): Multilingual labels for recipe note sections.
+        Contains translations for recipe section headers and common labels used when
+        creating notes in various notes applications, keyed by language code.
+    LABELS_EN (Dict[str, str]): English translations for recipe labels.
+    LABELS_PL (Dict[str, str]): Polish translations for recipe labels.
+"""
+
+import sys
 from typing import Dict
 
 NOTES_LABELS: Dict[str, Dict[str, str]] = {
-    """Multilingual labels for recipe note sections.
-    
-    Contains translations for recipe section headers and common labels
-    used when creating notes in various notes applications.
-    
-    Attributes:
-        en (dict[str, str]): English translations for recipe labels.
-        pl (dict[str, str]): Polish translations for recipe labels.
-    """
     "en": {
         "ingredients": "Ingredients",
         "cooking_time_temperature": "Cooking time and temperature",
@@ -19,6 +19,7 @@ NOTES_LABELS: Dict[str, Dict[str, str]] = {
         "hints": "Hints",
         "url": "Recipe URL",
         "domain": "Domain",
+        "content_hash": "Content Hash",
         "untitled_recipe": "Untitled Recipe",
     },
     "pl": {
@@ -28,6 +29,15 @@ NOTES_LABELS: Dict[str, Dict[str, str]] = {
         "hints": "Wskazówki",
         "url": "URL przepisu",
         "domain": "Strona",
+        "content_hash": "Suma kontrolna",
         "untitled_recipe": "Przepis bez nazwy",
     }
-}
\ No newline at end of file
+}
+
+# Intern label keys and values, so lookups in note building code compare by identity
+for _language, _labels in NOTES_LABELS.items():
+    NOTES_LABELS[_language] = {sys.intern(key): sys.intern(value) for key, value in _labels.items()}
+del _language, _labels
+
+LABELS_EN: Dict[str, str] = NOTES_LABELS["en"]
+LABELS_PL: Dict[str, str] = NOTES_LABELS["pl"]
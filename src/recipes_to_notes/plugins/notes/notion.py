@@ -1,10 +1,179 @@
 from recipes_to_notes.base_classes import BaseNotesApp
 from recipes_to_notes.schema import EnrichedRecipe
 import os
-from typing import Optional
+from typing import Any, Awaitable, Callable, ClassVar, Optional
 import logging
-from notion_client import AsyncClient, Client
+from notion_client import AsyncClient
+from notion_client.errors import HTTPResponseError
 from recipes_to_notes.i18n import NOTES_LABELS
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import asyncio
+import copy
+import hashlib
+import math
+import json
+import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of requests in flight to Notion API from a single app instance. This is not
+# a rate limit: short requests can exceed the average of 3 requests per second allowed by Notion,
+# in which case rate limited (429) responses are retried after the time Notion asks for
+MAX_CONCURRENT_REQUESTS: int = 3
+# Maximum number of blocks accepted by Notion API in a single request
+MAX_BLOCKS_PER_REQUEST: int = 100
+# Maximum number of results returned by Notion API in a single paginated response
+MAX_PAGE_SIZE: int = 100
+# Maximum number of attempts of a request failing due to rate limiting or server error
+MAX_REQUEST_ATTEMPTS: int = 5
+
+
+class _OrjsonHTTPClient(httpx.AsyncClient):
+    """HTTP client serializing JSON request bodies with orjson instead of the standard library."""
+
+    def build_request(
+        self, method: str, url: Any, *, json: Any = None, headers: Any = None, **kwargs: Any
+    ) -> httpx.Request:
+        """Build a request, encoding the JSON body with orjson.
+
+        Args:
+            method (str): The HTTP method.
+            url (Any): The request URL.
+            json (Any): The JSON-serializable request body.
+            headers (Any): The request headers.
+            **kwargs (Any): Other arguments passed to httpx.AsyncClient.build_request.
+
+        Returns:
+            httpx.Request: The built request.
+        """
+        if json is not None:
+            headers = httpx.Headers(headers)
+            headers["Content-Type"] = "application/json"
+            kwargs["content"] = orjson.dumps(json)
+        return super().build_request(method, url, headers=headers, **kwargs)
+
+
+def _text_block(block_type: str, content: str) -> dict:
+    """Create a Notion block of the given type containing plain text.
+
+    Args:
+        block_type (str): The Notion block type, e.g. "paragraph" or "heading_2".
+        content (str): The text content of the block.
+
+    Returns:
+        dict: The Notion block object.
+    """
+    return {
+        "object": "block",
+        "type": block_type,
+        block_type: {
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": content
+                    }
+                }
+            ]
+        }
+    }
+
+
+def _bullet(content: str) -> dict:
+    """Create a Notion bulleted list item block containing plain text.
+
+    Args:
+        content (str): The text content of the block.
+
+    Returns:
+        dict: The Notion block object.
+    """
+    return {
+        "object": "block",
+        "type": "bulleted_list_item",
+        "bulleted_list_item": {"rich_text": [{"type": "text", "text": {"content": content}}]},
+    }
+
+
+def _numbered(content: str) -> dict:
+    """Create a Notion numbered list item block containing plain text.
+
+    Args:
+        content (str): The text content of the block.
+
+    Returns:
+        dict: The Notion block object.
+    """
+    return {
+        "object": "block",
+        "type": "numbered_list_item",
+        "numbered_list_item": {"rich_text": [{"type": "text", "text": {"content": content}}]},
+    }
+
+
+def _paragraph(content: str) -> dict:
+    """Create a Notion paragraph block containing plain text.
+
+    Args:
+        content (str): The text content of the block.
+
+    Returns:
+        dict: The Notion block object.
+    """
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": content}}]},
+    }
+
+
+# Section heading blocks for each language, built once and copied into page content
+_HEADING_TEMPLATES: dict[str, dict[str, dict]] = {
+    language: {
+        section: _text_block("heading_2", labels[section])
+        for section in ("ingredients", "cooking_time_temperature", "instructions", "hints")
+    }
+    for language, labels in NOTES_LABELS.items()
+}
+
+
+def _content_hash(children: list[dict]) -> str:
+    """Compute a stable hash of Notion page content blocks.
+
+    Args:
+        children (list[dict]): The Notion block objects representing page content.
+
+    Returns:
+        str: Hex digest identifying the content.
+    """
+    return hashlib.blake2b(json.dumps(children, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """Parse the Retry-After header, given either in seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): The value of the Retry-After header.
+
+    Returns:
+        float: Number of seconds to wait, or 0 if the header is missing or malformed.
+    """
+    if not value:
+        return 0.0
+    try:
+        seconds = float(value)
+        return max(seconds, 0.0) if math.isfinite(seconds) else 0.0
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
 
 
 class NotionNotesApp(BaseNotesApp):
@@ -14,20 +183,38 @@ class NotionNotesApp(BaseNotesApp):
     in a Notion database, with support for multiple languages.
     
     Attributes:
-        database_id (str): The ID of the target Notion database.
+        database_id (Optional[str]): The ID of the target Notion database, resolved on first use.
         database_name (str): The name of the target Notion database.
-        client (Client): Synchronous Notion client for database queries.
         async_client (AsyncClient): Asynchronous Notion client for page operations.
         language (str): Language code for internationalized labels.
-        logger (logging.Logger): Logger instance for this class.
+        max_concurrency (int): Maximum number of notes created concurrently by create_notes.
+        _labels (dict[str, str]): Internationalized labels for the configured language.
+        _headings (dict[str, dict]): Section heading blocks for the configured language.
+        _semaphore (asyncio.Semaphore): Semaphore limiting concurrent requests to Notion API.
+        _page_cache (dict[str, Optional[dict]]): Pages already looked up, keyed by page name.
+        _page_cache_complete (bool): Whether _page_cache holds all pages of the database.
+        _page_cache_lock (asyncio.Lock): Lock preventing concurrent loading of all pages into _page_cache.
+        _connect_lock (asyncio.Lock): Lock preventing concurrent lookups of the database ID.
+        _page_locks (dict[str, asyncio.Lock]): Locks serializing upserts of pages with the same name.
+        _content_hash_enabled (Optional[bool]): Whether the database has the content hash property,
+            resolved on first use.
+        _database_key (tuple[str, str]): The Notion token and database name identifying the database.
+        _database_ids (dict[tuple[str, str], str]): IDs of databases shared by all instances, keyed by
+            Notion token and database name, as databases in different workspaces can share a name.
     """
 
-    database_id: str
+    database_id: Optional[str]
     database_name: str
-    client: Client
     async_client: AsyncClient
+    _database_ids: ClassVar[dict[tuple[str, str], str]] = {}
 
-    def __init__(self, database_name: str, notion_token: Optional[str] = os.getenv('NOTION_TOKEN'), language: Optional[str] = "en") -> None:
+    def __init__(
+        self,
+        database_name: str,
+        notion_token: Optional[str] = os.getenv('NOTION_TOKEN'),
+        language: Optional[str] = "en",
+        max_concurrency: int = 5,
+    ) -> None:
         """Initialize the Notion notes app integration.
         
         Args:
@@ -35,70 +222,278 @@ class NotionNotesApp(BaseNotesApp):
             notion_token (Optional[str]): The Notion API token. If None, will attempt to read
                 from NOTION_TOKEN environment variable.
             language (Optional[str]): Language code for internationalized labels. Defaults to "en".
+            max_concurrency (int): Maximum number of notes created concurrently by create_notes.
+                Defaults to 5.
                 
         Raises:
-            ValueError: If no Notion token is provided or the specified database
-                is not found.
+            ValueError: If no Notion token is provided.
         """
-        self.logger = logging.getLogger(__name__)
         if notion_token is None or notion_token == '':
             raise ValueError("NOTION_TOKEN is not set")
-        self.client = Client(auth=notion_token)
-        self.async_client = AsyncClient(auth=notion_token)
+        # Connection pool sized to the number of requests that can be in flight at once
+        self.async_client = AsyncClient(
+            auth=notion_token,
+            client=_OrjsonHTTPClient(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONCURRENT_REQUESTS,
+                    max_keepalive_connections=MAX_CONCURRENT_REQUESTS
+                )
+            )
+        )
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._page_cache: dict[str, Optional[dict]] = {}
+        self._page_cache_complete = False
+        self._page_cache_lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
+        self._page_locks: dict[str, asyncio.Lock] = {}
+        self._content_hash_enabled: Optional[bool] = None
 
         self.database_name = database_name
         self.language = language
-        database_id_query = self.client.search(query=self.database_name, filter={"property": "object", "value": "database"})
-        if len(database_id_query['results']) == 0:
-            raise ValueError(f"Database with name {self.database_name} not found")
-        self.database_id = database_id_query['results'][0]['id']
+        self._labels = NOTES_LABELS[language]
+        self._headings = _HEADING_TEMPLATES[language]
+        self.max_concurrency = max_concurrency
+        self._database_key = (notion_token, database_name)
+        self.database_id = self._database_ids.get(self._database_key)
+
+    async def connect(self) -> str:
+        """Resolve the ID of the target database and check its properties.
+        
+        Called automatically before the first note is created. It can be awaited upfront
+        to validate the configuration early. The ID is cached and shared by all instances
+        using the same database with the same token, and concurrent calls wait for a single lookup.
+        If the database has no content hash property, page content is rewritten on every update.
+        
+        Returns:
+            str: The ID of the target database.
+            
+        Raises:
+            ValueError: If the specified database is not found.
+        """
+        if self.database_id is None or self._content_hash_enabled is None:
+            async with self._connect_lock:
+                if self.database_id is None:
+                    if self._database_key not in self._database_ids:
+                        search_result = await self._with_retry(
+                            self.async_client.search,
+                            query=self.database_name, filter={"property": "object", "value": "database"}
+                        )
+                        if len(search_result['results']) == 0:
+                            raise ValueError(f"Database with name {self.database_name} not found")
+                        self._database_ids[self._database_key] = search_result['results'][0]['id']
+                    self.database_id = self._database_ids[self._database_key]
+                if self._content_hash_enabled is None:
+                    # Notion rejects unknown properties, so the content hash is written only if
+                    # the database has the property
+                    database = await self._with_retry(
+                        self.async_client.databases.retrieve, database_id=self.database_id
+                    )
+                    content_hash_property = database['properties'].get(self._labels["content_hash"])
+                    self._content_hash_enabled = (
+                        content_hash_property is not None and content_hash_property['type'] == 'rich_text'
+                    )
+                    if not self._content_hash_enabled:
+                        logger.info(
+                            "Database %s has no '%s' text property, page content will be rewritten on every update",
+                            self.database_name, self._labels["content_hash"]
+                        )
+        return self.database_id
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the Notion client."""
+        await self.async_client.aclose()
+
+    async def _with_retry(
+        self, fn: Callable[..., Awaitable[Any]], *args: Any, idempotent: bool = True, **kwargs: Any
+    ) -> Any:
+        """Call Notion API, retrying requests failed due to rate limiting or server errors.
+        
+        Concurrent requests are limited by the instance semaphore, which is released while
+        waiting before the next attempt. The wait time grows exponentially (1s, 2s, 4s, ...),
+        or follows the Retry-After header of rate limited responses if it is longer.
+        Server errors are retried only for idempotent requests, as the server may have
+        already applied the request, e.g. created a page, before failing.
+        
+        Args:
+            fn (Callable[..., Awaitable[Any]]): The Notion client endpoint method to call.
+            *args (Any): Positional arguments passed to fn.
+            idempotent (bool): Whether repeating the request has the same effect as sending it once.
+                If False, only rate limited requests, which Notion doesn't apply, are retried.
+            **kwargs (Any): Keyword arguments passed to fn.
+            
+        Returns:
+            Any: The response of the Notion API.
+            
+        Raises:
+            HTTPResponseError: If the request fails with a non-retryable status or
+                the maximum number of attempts is reached.
+        """
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            try:
+                async with self._semaphore:
+                    return await fn(*args, **kwargs)
+            except HTTPResponseError as e:
+                retryable = e.status == 429 or (idempotent and 500 <= e.status < 600)
+                if not retryable or attempt == MAX_REQUEST_ATTEMPTS - 1:
+                    raise
+                delay = 2 ** attempt
+                if e.status == 429:
+                    # Back off exponentially even if Notion keeps asking to retry immediately
+                    delay = max(_parse_retry_after(e.headers.get("Retry-After")), delay)
+                logger.warning("Notion API responded with status %s, retrying in %ss", e.status, delay)
+                await asyncio.sleep(delay)
+
+    async def _load_pages(self) -> None:
+        """Load all pages of the database into the page cache, keyed by page name.
+        
+        Paginating the whole database takes one request per 100 pages, instead of one
+        request per looked up page name. Pages are loaded only once, even if called
+        concurrently. In case of error, lookups fall back to querying by page name.
+        """
+        await self.connect()
+        async with self._page_cache_lock:
+            if self._page_cache_complete:
+                return
+            try:
+                pages = {}
+                start_cursor = None
+                while True:
+                    query_result = await self._with_retry(
+                        self.async_client.databases.query,
+                        database_id=self.database_id,
+                        start_cursor=start_cursor,
+                        page_size=MAX_PAGE_SIZE
+                    )
+                    for page in query_result['results']:
+                        page_name = ''.join(text['plain_text'] for text in page['properties']['Name']['title'])
+                        pages.setdefault(page_name, page)
+                    if not query_result['has_more']:
+                        break
+                    start_cursor = query_result['next_cursor']
+            except Exception as e:
+                logger.error("Failed to load pages of the database: %s", e)
+                return
+            # Pages created or updated in the meantime are more recent than the loaded ones
+            self._page_cache = pages | {name: page for name, page in self._page_cache.items() if page}
+            self._page_cache_complete = True
 
-    async def _check_page_exists(self, page_name: str) -> Optional[str]:
+    async def prefetch(self) -> None:
+        """Load all pages of the database, so creating multiple notes doesn't query each page name.
+
+        Raises:
+            ValueError: If the target database is not found.
+        """
+        await self._load_pages()
+
+    async def _check_page_exists(self, page_name: str) -> tuple[Optional[str], Optional[dict]]:
         """Check if a page with the given name already exists in the database.
         
+        Results are cached for the lifetime of the instance, so repeated lookups
+        of the same page name don't query the database again. If all pages of the
+        database are being loaded, the lookup waits for them instead of querying.
+        
         Args:
             page_name (str): The name of the page to search for.
             
         Returns:
-            Optional[str]: The page ID if a page with the given name exists, None otherwise.
+            tuple[Optional[str], Optional[dict]]: The page ID and the page object if a page
+                with the given name exists, (None, None) otherwise.
+            
+        Raises:
+            ValueError: If the target database is not found.
         """
+        if page_name not in self._page_cache and self._page_cache_lock.locked():
+            async with self._page_cache_lock:
+                pass
+        if page_name in self._page_cache:
+            page = self._page_cache[page_name]
+            return (page['id'], page) if page else (None, None)
+        if self._page_cache_complete:
+            return None, None
+
+        await self.connect()
         try:
             # Query the database for pages with the same name
-            query_result = await self.async_client.databases.query(
+            query_result = await self._with_retry(
+                self.async_client.databases.query,
                 database_id=self.database_id,
                 filter={
                     "property": "Name",
                     "title": {
                         "equals": page_name
                     }
-                }
+                },
+                page_size=1
             )
             
-            # Return page ID if any pages were found, None otherwise
-            if len(query_result['results']) > 0:
-                return query_result['results'][0]['id']
-            return None
+            # Return the page if any pages were found, None otherwise
+            page = query_result['results'][0] if len(query_result['results']) > 0 else None
+            self._page_cache[page_name] = page
+            return (page['id'], page) if page else (None, None)
             
         except Exception as e:
-            self.logger.error(f"Failed to check if page exists: {str(e)}")
+            logger.error("Failed to check if page exists: %s", e)
             # In case of error, assume page doesn't exist to avoid blocking creation
-            return None
+            return None, None
 
-    def _prepare_page_properties(self, recipe: EnrichedRecipe) -> dict:
-        """Prepare the page properties for Notion page creation/update.
+    def _build_payload(self, recipe: EnrichedRecipe) -> tuple[dict, Optional[dict], list[dict], str]:
+        """Prepare the page properties, cover and content for Notion page creation/update.
+        
+        Each recipe attribute is read once and all parts of the request are built
+        in a single pass.
         
         Args:
-            recipe (EnrichedRecipe): The enriched recipe data to convert to Notion properties.
+            recipe (EnrichedRecipe): The enriched recipe data to convert to a Notion page.
             
         Returns:
-            dict: A dictionary of Notion page properties.
+            tuple[dict, Optional[dict], list[dict], str]: A dictionary of Notion page properties
+                without the content hash, the cover image configuration (or None if no image URL),
+                a list of Notion block objects representing the recipe content, and the hash of that content.
         """
+        labels = self._labels
+        headings = self._headings
+        ingredients = recipe.ingredients
+        cooking_time_temperature = recipe.cooking_time_temperature
+        instructions = recipe.instructions
+        hints = recipe.hints
+        url = recipe.url
+        domain = recipe.domain
+        image_url = recipe.image_url
+
+        children = []
+        
+        # Add Ingredients section with each ingredient as a bullet point
+        if ingredients:
+            children.append(copy.copy(headings["ingredients"]))
+            children.extend(map(_bullet, ingredients))
+        
+        # Add Cooking Time & Temperature section
+        if cooking_time_temperature:
+            children += [
+                copy.copy(headings["cooking_time_temperature"]),
+                _paragraph(cooking_time_temperature),
+            ]
+        
+        # Add Instructions section with each instruction as a numbered list item
+        if instructions:
+            children.append(copy.copy(headings["instructions"]))
+            children.extend(map(_numbered, instructions))
+        
+        # Add Hints section
+        if hints:
+            children += [
+                copy.copy(headings["hints"]),
+                _paragraph(hints),
+            ]
+
+        content_hash = _content_hash(children)
+
         properties = {
             "Name": {
                 "title": [
                     {
                         "text": {
-                            "content": recipe.name or NOTES_LABELS[self.language]["untitled_recipe"]
+                            "content": recipe.name or labels["untitled_recipe"]
                         }
                     }
                 ]
@@ -106,189 +501,67 @@ class NotionNotesApp(BaseNotesApp):
         }
         
         # Add Recipe URL if provided
-        if recipe.url:
-            properties[NOTES_LABELS[self.language]["url"]] = {
-                "url": recipe.url
+        if url:
+            properties[labels["url"]] = {
+                "url": url
             }
 
         # Add Domain if provided
-        if recipe.domain:
-            properties[NOTES_LABELS[self.language]["domain"]] = {
+        if domain:
+            properties[labels["domain"]] = {
                 "select": {
-                    "name": recipe.domain
+                    "name": domain
                 }
             }
-        
-        return properties
 
-    def _prepare_page_cover(self, recipe: EnrichedRecipe) -> Optional[dict]:
-        """Prepare the cover image for Notion page.
-        
-        Args:
-            recipe (EnrichedRecipe): The enriched recipe data containing the image URL.
-            
-        Returns:
-            Optional[dict]: A dictionary with cover image configuration, or None if no image URL.
-        """
-        if recipe.image_url:
-            return {
+        # Add cover image if provided
+        cover = None
+        if image_url:
+            cover = {
                 "type": "external",
                 "external": {
-                    "url": recipe.image_url
+                    "url": image_url
                 }
             }
-        return None
+        
+        return properties, cover, children, content_hash
 
-    def _prepare_page_content(self, recipe: EnrichedRecipe) -> list[dict]:
-        """Prepare the content blocks for Notion page.
+    def _content_hash_properties(self, content_hash: str) -> dict:
+        """Build the Notion page properties storing the content hash.
         
         Args:
-            recipe (EnrichedRecipe): The enriched recipe data to convert to Notion blocks.
+            content_hash (str): The hash of the page content.
             
         Returns:
-            list[dict]: A list of Notion block objects representing the recipe content.
+            dict: The content hash property, or an empty dictionary if the database doesn't have it.
         """
-        children = []
-        
-        # Add Ingredients section
-        if recipe.ingredients:
-            children.extend([
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": NOTES_LABELS[self.language]["ingredients"]
-                                }
-                            }
-                        ]
-                    }
-                }
-            ])
-            
-            # Add each ingredient as a bullet point
-            for ingredient in recipe.ingredients:
-                children.append({
-                    "object": "block",
-                    "type": "bulleted_list_item",
-                    "bulleted_list_item": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": ingredient
-                                }
-                            }
-                        ]
-                    }
-                })
-        
-        # Add Cooking Time & Temperature section
-        if recipe.cooking_time_temperature:
-            children.extend([
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": NOTES_LABELS[self.language]["cooking_time_temperature"]
-                                }
-                            }
-                        ]
-                    }
-                },
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": recipe.cooking_time_temperature
-                                }
-                            }
-                        ]
+        if not self._content_hash_enabled:
+            return {}
+        return {
+            self._labels["content_hash"]: {
+                "rich_text": [
+                    {
+                        "text": {
+                            "content": content_hash
+                        }
                     }
-                }
-            ])
+                ]
+            }
+        }
+
+    def _get_content_hash(self, page: dict) -> Optional[str]:
+        """Read the content hash stored in Notion page properties.
         
-        # Add Instructions section
-        if recipe.instructions:
-            children.extend([
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": NOTES_LABELS[self.language]["instructions"]
-                                }
-                            }
-                        ]
-                    }
-                }
-            ])
+        Args:
+            page (dict): The Notion page object.
             
-            # Add each instruction as a numbered list item
-            for i, instruction in enumerate(recipe.instructions, 1):
-                children.append({
-                    "object": "block",
-                    "type": "numbered_list_item",
-                    "numbered_list_item": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": instruction
-                                }
-                            }
-                        ]
-                    }
-                })
-        
-        # Add Hints section
-        if recipe.hints:
-            children.extend([
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": NOTES_LABELS[self.language]["hints"]
-                                }
-                            }
-                        ]
-                    }
-                },
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": recipe.hints
-                                }
-                            }
-                        ]
-                    }
-                }
-            ])
-        
-        return children
+        Returns:
+            Optional[str]: The stored content hash, or None if the page has none.
+        """
+        content_hash = page['properties'].get(self._labels["content_hash"])
+        if not content_hash or not content_hash.get('rich_text'):
+            return None
+        return ''.join(text['plain_text'] for text in content_hash['rich_text'])
 
     async def _create_page(self, recipe: EnrichedRecipe) -> dict:
         """Create a new page in Notion.
@@ -302,31 +575,145 @@ class NotionNotesApp(BaseNotesApp):
         Raises:
             Exception: If page creation fails.
         """
-        properties = self._prepare_page_properties(recipe)
-        cover = self._prepare_page_cover(recipe)
-        children = self._prepare_page_content(recipe)
+        await self.connect()
+        properties, cover, children, content_hash = self._build_payload(recipe)
+        page_name = recipe.name or self._labels["untitled_recipe"]
+        new_page = None
         
         try:
-            new_page = await self.async_client.pages.create(
+            # Page is created with as much content as a single request accepts,
+            # the remainder is appended in chunks
+            chunked = len(children) > MAX_BLOCKS_PER_REQUEST
+            new_page = await self._with_retry(
+                self.async_client.pages.create,
                 parent={"database_id": self.database_id},
-                properties=properties,
+                properties=properties if chunked else properties | self._content_hash_properties(content_hash),
                 cover=cover,
-                children=children
+                children=children[:MAX_BLOCKS_PER_REQUEST],
+                idempotent=False
             )
+            # Cached right away, so the page is updated instead of created again if appending fails
+            self._page_cache[page_name] = new_page
+            if chunked:
+                await self._append_blocks(new_page['id'], children[MAX_BLOCKS_PER_REQUEST:])
+                # Content hash is stored only once all content is in place, so a page left
+                # incomplete by a failed append is rewritten on the next update
+                content_hash_properties = self._content_hash_properties(content_hash)
+                if content_hash_properties:
+                    new_page = await self._with_retry(
+                        self.async_client.pages.update,
+                        page_id=new_page['id'],
+                        properties=content_hash_properties
+                    )
+                    self._page_cache[page_name] = new_page
             
-            self.logger.info(f"Successfully created Notion page: {new_page['id']}")
+            logger.info("Successfully created Notion page: %s", new_page['id'])
             return new_page
             
         except Exception as e:
-            self.logger.error(f"Failed to create Notion page: {str(e)}")
+            logger.error("Failed to create Notion page: %s", e)
+            if new_page is None:
+                # The page may have been created despite the error, so it's looked up again next time
+                self._page_cache.pop(page_name, None)
             raise
 
-    async def _update_page(self, page_id: str, recipe: EnrichedRecipe) -> dict:
+    async def _list_blocks(self, page_id: str) -> list[dict]:
+        """List all content blocks of a page, following pagination.
+
+        Args:
+            page_id (str): The ID of the page.
+
+        Returns:
+            list[dict]: The Notion block objects of the page.
+        """
+        blocks = []
+        start_cursor = None
+        while True:
+            response = await self._with_retry(
+                self.async_client.blocks.children.list,
+                block_id=page_id,
+                start_cursor=start_cursor,
+                page_size=MAX_PAGE_SIZE
+            )
+            blocks.extend(response['results'])
+            if not response['has_more']:
+                return blocks
+            start_cursor = response['next_cursor']
+
+    async def _append_blocks(self, page_id: str, children: list[dict]) -> None:
+        """Append content blocks to a page in chunks accepted by Notion API.
+
+        Chunks are appended sequentially to preserve order of the content.
+
+        Args:
+            page_id (str): The ID of the page.
+            children (list[dict]): The Notion block objects to append.
+        """
+        for i in range(0, len(children), MAX_BLOCKS_PER_REQUEST):
+            await self._with_retry(
+                self.async_client.blocks.children.append,
+                block_id=page_id,
+                children=children[i:i + MAX_BLOCKS_PER_REQUEST],
+                idempotent=False
+            )
+
+    async def _update_blocks(self, blocks: list[dict], children: list[dict]) -> None:
+        """Update text of existing blocks in place to match new content blocks of the same types.
+
+        Only blocks whose text differs are updated, concurrently.
+
+        Args:
+            blocks (list[dict]): The existing Notion block objects of the page.
+            children (list[dict]): The new Notion block objects, with types matching blocks.
+        """
+        changed = [
+            (block, child) for block, child in zip(blocks, children)
+            if ''.join(text['plain_text'] for text in block[block['type']]['rich_text'])
+            != ''.join(text['text']['content'] for text in child[child['type']]['rich_text'])
+        ]
+        await asyncio.gather(*(
+            self._with_retry(
+                self.async_client.blocks.update,
+                block_id=block['id'],
+                **{child['type']: child[child['type']]}
+            )
+            for block, child in changed
+        ))
+
+    async def _delete_blocks(self, blocks: list[dict]) -> bool:
+        """Delete the given blocks concurrently.
+
+        Number of requests in flight is limited by the instance semaphore. Failures are
+        logged and do not prevent remaining blocks from being deleted.
+
+        Args:
+            blocks (list[dict]): The Notion block objects to delete.
+
+        Returns:
+            bool: True if all blocks were deleted, False if any deletion failed.
+        """
+        results = await asyncio.gather(
+            *(self._with_retry(self.async_client.blocks.delete, block_id=block['id']) for block in blocks),
+            return_exceptions=True
+        )
+        deleted = True
+        for block, result in zip(blocks, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to delete block %s: %s", block['id'], result)
+                deleted = False
+        return deleted
+
+    async def _update_page(self, page_id: str, recipe: EnrichedRecipe, page: Optional[dict] = None) -> dict:
         """Update an existing page in Notion.
         
+        Content blocks are rewritten only if the content hash stored in the page
+        differs from the hash of the new content, or if the database has no content hash property.
+        
         Args:
             page_id (str): The ID of the existing page to update.
             recipe (EnrichedRecipe): The enriched recipe data to update the page with.
+            page (Optional[dict]): The existing page object, if already known. If None,
+                the page is retrieved from Notion.
             
         Returns:
             dict: The updated Notion page object.
@@ -334,61 +721,109 @@ class NotionNotesApp(BaseNotesApp):
         Raises:
             Exception: If page update fails.
         """
-        properties = self._prepare_page_properties(recipe)
-        cover = self._prepare_page_cover(recipe)
+        await self.connect()
+        properties, cover, children, content_hash = self._build_payload(recipe)
         
         try:
-            # Update page properties and cover
-            updated_page = await self.async_client.pages.update(
+            content_complete = True
+            if page is None:
+                page = await self._with_retry(self.async_client.pages.retrieve, page_id=page_id)
+
+            if self._content_hash_enabled and self._get_content_hash(page) == content_hash:
+                logger.info("Content of Notion page %s is unchanged, skipping content update", page_id)
+            else:
+                existing_blocks = await self._list_blocks(page_id)
+
+                if [block['type'] for block in existing_blocks] == [block['type'] for block in children]:
+                    # Same structure of content, update changed blocks in place
+                    await self._update_blocks(existing_blocks, children)
+                else:
+                    # Delete existing content blocks concurrently
+                    content_complete = await self._delete_blocks(existing_blocks)
+                    
+                    # Add new content
+                    await self._append_blocks(page_id, children)
+
+            # Update page properties and cover, including content hash once content is in place.
+            # If stale blocks were left on the page, the previous hash is kept so the content
+            # is rewritten on the next update
+            if content_complete:
+                properties |= self._content_hash_properties(content_hash)
+            else:
+                logger.warning("Content of Notion page %s was not fully replaced, keeping its content hash", page_id)
+            updated_page = await self._with_retry(
+                self.async_client.pages.update,
                 page_id=page_id,
                 properties=properties,
                 cover=cover
             )
             
-            # Get existing page content to clear it
-            existing_blocks = await self.async_client.blocks.children.list(block_id=page_id)
-            
-            # Delete existing content blocks
-            for block in existing_blocks['results']:
-                await self.async_client.blocks.delete(block_id=block['id'])
-            
-            # Add new content
-            children = self._prepare_page_content(recipe)
-            if children:
-                await self.async_client.blocks.children.append(
-                    block_id=page_id,
-                    children=children
-                )
-            
-            self.logger.info(f"Successfully updated Notion page: {page_id}")
+            self._page_cache[recipe.name or self._labels["untitled_recipe"]] = updated_page
+            logger.info("Successfully updated Notion page: %s", page_id)
             return updated_page
             
         except Exception as e:
-            self.logger.error(f"Failed to update Notion page: {str(e)}")
+            logger.error("Failed to update Notion page: %s", e)
             raise
 
-    async def create_note(self, recipe: EnrichedRecipe) -> dict:
+    async def create_note(self, recipe: EnrichedRecipe, assume_new: bool = False) -> dict:
         """Create or update a note in Notion using the provided EnrichedRecipe schema (upsert).
         
         This method implements an upsert operation - it will update an existing page
         if one with the same name exists, otherwise it will create a new page.
+        Concurrent calls for recipes with the same name are serialized, so only one page is created.
         
         Args:
             recipe (EnrichedRecipe): The enriched recipe data to create or update a note for.
+            assume_new (bool): If True, skip checking for an existing page and always create
+                a new one. Use only when the database is known not to contain the recipe.
             
         Returns:
             dict: The created or updated Notion page object.
         """
+        await self.connect()
         
         # Check if a page with the same name already exists
-        page_name = recipe.name or NOTES_LABELS[self.language]["untitled_recipe"]
-        existing_page_id = await self._check_page_exists(page_name)
+        page_name = recipe.name or self._labels["untitled_recipe"]
+        async with self._page_locks.setdefault(page_name, asyncio.Lock()):
+            existing_page_id, existing_page = (None, None) if assume_new else await self._check_page_exists(page_name)
+            
+            if existing_page_id:
+                # Update existing page
+                logger.info("Updating existing page '%s' with ID: %s", page_name, existing_page_id)
+                return await self._update_page(existing_page_id, recipe, existing_page)
+            else:
+                # Create new page
+                logger.info("Creating new page '%s'", page_name)
+                return await self._create_page(recipe)
+
+    async def create_notes(self, recipes: list[EnrichedRecipe], assume_new: bool = False) -> list:
+        """Create or update notes in Notion for multiple recipes concurrently.
+        
+        Up to max_concurrency recipes are processed at the same time. A failure to create
+        a note is logged and does not stop processing of the remaining recipes.
         
-        if existing_page_id:
-            # Update existing page
-            self.logger.info(f"Updating existing page '{page_name}' with ID: {existing_page_id}")
-            return await self._update_page(existing_page_id, recipe)
-        else:
-            # Create new page
-            self.logger.info(f"Creating new page '{page_name}'")
-            return await self._create_page(recipe)
\ No newline at end of file
+        Args:
+            recipes (list[EnrichedRecipe]): The enriched recipe data to create or update notes for.
+            assume_new (bool): If True, skip checking for existing pages and always create
+                new ones. Use only when the database is known not to contain the recipes.
+            
+        Returns:
+            list: The created or updated Notion page objects, in the same order as recipes.
+                Recipes that failed are represented by the raised exception.
+        """
+        # Resolve database and existing pages once, before notes are created concurrently
+        await self.connect()
+        if not assume_new and len(recipes) > 1:
+            await self.prefetch()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _create_note(recipe: EnrichedRecipe) -> dict:
+            async with semaphore:
+                return await self.create_note(recipe, assume_new=assume_new)
+
+        results = await asyncio.gather(*(_create_note(recipe) for recipe in recipes), return_exceptions=True)
+        for recipe, result in zip(recipes, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to create note for recipe from %s: %s", recipe.url, result)
+        return results
@@ -3,15 +3,20 @@ from langchain_core.language_models.chat_models import BaseChatModel
 from recipes_to_notes.base_classes import BaseSchemaExtractionProvider
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Models shared by all instances with the same configuration, so their HTTP connection pools are reused
+_MODEL_CACHE: dict[tuple[str, str, str, str], AzureChatOpenAI] = {}
+
 
 class AzureOpenAI(BaseSchemaExtractionProvider):
     """Azure OpenAI implementation for schema extraction.
     
     This class provides a language model interface using Azure OpenAI services
     for extracting structured recipe data from unstructured content.
+    Instances with the same configuration share a single model instance.
     
     Attributes:
-        logger (logging.Logger): Logger instance for this class.
         model (AzureChatOpenAI): The configured AzureChatOpenAI model instance.
     """
 
@@ -24,19 +29,22 @@ class AzureOpenAI(BaseSchemaExtractionProvider):
             azure_deployment (str): The name of the Azure OpenAI deployment to use.
             api_version (str): The API version to use for requests.
         """
-        self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Initializing AzureOpenAI with endpoint: {azure_endpoint}")
-        self.logger.info(f"Using deployment: {azure_deployment}")
-        self.logger.info(f"Using API version: {api_version}")
-
-        self.model = AzureChatOpenAI(
-            azure_endpoint=azure_endpoint,
-            api_key=api_key,
-            azure_deployment=azure_deployment,
-            openai_api_version=api_version,
-            temperature=0,
+        logger.info(
+            "Initializing AzureOpenAI with endpoint: %s, deployment: %s, API version: %s",
+            azure_endpoint, azure_deployment, api_version
         )
 
+        key = (azure_endpoint, api_key, azure_deployment, api_version)
+        if key not in _MODEL_CACHE:
+            _MODEL_CACHE[key] = AzureChatOpenAI(
+                azure_endpoint=azure_endpoint,
+                api_key=api_key,
+                azure_deployment=azure_deployment,
+                openai_api_version=api_version,
+                temperature=0,
+            )
+        self.model = _MODEL_CACHE[key]
+
     def get_model(self) -> BaseChatModel:
         """Get the configured Azure OpenAI model.
         
@@ -3,15 +3,20 @@ from langchain_core.language_models.chat_models import BaseChatModel
 from recipes_to_notes.base_classes import BaseSchemaExtractionProvider
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Models shared by all instances with the same configuration, so their HTTP connection pools are reused
+_MODEL_CACHE: dict[tuple[str, str], ChatOpenAI] = {}
+
 
 class OpenAI(BaseSchemaExtractionProvider):
     """OpenAI implementation for schema extraction.
     
     This class provides a language model interface using OpenAI services
     for extracting structured recipe data from unstructured content.
+    Instances with the same configuration share a single model instance.
     
     Attributes:
-        logger (logging.Logger): Logger instance for this class.
         model (ChatOpenAI): The configured ChatOpenAI model instance.
     """
 
@@ -22,14 +27,16 @@ class OpenAI(BaseSchemaExtractionProvider):
             api_key (str): The API key for authenticating with OpenAI.
             model (str): The model to use for schema extraction.
         """
-        self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Initializing OpenAI with model: {model}")
+        logger.info("Initializing OpenAI with model: %s", model)
 
-        self.model = ChatOpenAI(
-            api_key=api_key,
-            model=model,
-            temperature=0,
-        )
+        key = (api_key, model)
+        if key not in _MODEL_CACHE:
+            _MODEL_CACHE[key] = ChatOpenAI(
+                api_key=api_key,
+                model=model,
+                temperature=0,
+            )
+        self.model = _MODEL_CACHE[key]
 
     def get_model(self) -> BaseChatModel:
         """Get the configured OpenAI model.
@@ -1,21 +1,31 @@
-from langchain_community.document_loaders import SpiderLoader
 from langchain_core.documents.base import Document
 from recipes_to_notes.base_classes import BaseScraper
 from typing import Optional
 import os
 import logging
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Spider API endpoint scraping a single page when called with limit of 1
+SPIDER_CRAWL_URL: str = "https://api.spider.cloud/crawl"
+# Parameters used when none are provided, returning content in LLM-friendly format
+DEFAULT_PARAMS: dict = {"return_format": "markdown", "metadata": True}
+# Timeout of a single scraping request in seconds, as rendering pages on Spider side can take a while
+REQUEST_TIMEOUT: float = 120.0
 
 
 class SpiderScraper(BaseScraper):
     """Web scraper implementation using the Spider API.
     
     This class provides web scraping functionality using Spider Cloud
-    to extract content from recipe websites.
+    to extract content from recipe websites. A single HTTP client is kept
+    for the lifetime of the scraper, so connections are reused between URLs.
     
     Attributes:
         api_key (str): The Spider API key for authentication.
-        params (Optional[dict]): Optional parameters for Spider API requests.
-        logger (logging.Logger): Logger instance for this class.
+        params (dict): Parameters for Spider API requests.
+        client (httpx.AsyncClient): The HTTP client used for Spider API requests.
     """
     def __init__(self, api_key: Optional[str] = os.getenv("SPIDER_API_KEY"), params: Optional[dict] = None) -> None:
         """Initialize the Spider scraper.
@@ -24,6 +34,7 @@ class SpiderScraper(BaseScraper):
             api_key (Optional[str]): The Spider API key. If None, will attempt to read from
                 SPIDER_API_KEY environment variable.
             params (Optional[dict]): Optional dictionary of parameters to pass to Spider API.
+                If None, content is returned as markdown along with page metadata.
                 
         Raises:
             ValueError: If no API key is provided or found in environment.
@@ -32,8 +43,15 @@ class SpiderScraper(BaseScraper):
             raise ValueError("Missing Spider API key. Provide it as an argument or set SPIDER_API_KEY in the environment variables.")
 
         self.api_key = api_key
-        self.params = params
-        self.logger = logging.getLogger(__name__)
+        self.params = DEFAULT_PARAMS if params is None else params
+        self.client = httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=REQUEST_TIMEOUT,
+        )
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the HTTP client."""
+        await self.client.aclose()
 
     async def scrape(self, url: str) -> list[Document]:
         """Scrape content from a URL using the Spider API.
@@ -46,10 +64,16 @@ class SpiderScraper(BaseScraper):
                 Returns an empty list if scraping fails.
         """
         try:
-            self.logger.info(f"Scraping {url}")
-            docs = await SpiderLoader(url=url, api_key=self.api_key, params=self.params).aload()
-            self.logger.info(f"Scraped {len(docs)} documents from {url}")
+            logger.info("Scraping %s", url)
+            response = await self.client.post(SPIDER_CRAWL_URL, json={"url": url, "limit": 1, **self.params})
+            response.raise_for_status()
+            docs = [
+                Document(page_content=page["content"], metadata=page.get("metadata") or {})
+                for page in (response.json() or [])[:1]
+                if page.get("content") is not None
+            ]
+            logger.info("Scraped %s documents from %s", len(docs), url)
         except Exception as e:
-            self.logger.error(f"Error scraping {url}: {e}")
+            logger.error("Error scraping %s: %s", url, e)
             return []
         return docs
\ No newline at end of file
@@ -3,10 +3,19 @@ from recipes_to_notes.schema_extraction import extract_schema
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.documents.base import Document
 from recipes_to_notes.schema import Recipe, EnrichedRecipe
-from typing import Optional
+from recipes_to_notes.cache import RecipeCache
+from typing import Any, Optional
+from urllib.parse import urlparse
+from functools import lru_cache
+import asyncio
 import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+# Whether setup_logging has already configured the root logger
+_LOGGING_READY: bool = False
+
 
 class RecipeToNote:
     """Main orchestration class for converting recipes to notes.
@@ -15,26 +24,25 @@ class RecipeToNote:
     to creating structured notes in a target notes application.
     
     Attributes:
-        logger (logging.Logger): Logger instance for this class.
         scraper (BaseScraper): The web scraper implementation to use.
         schema_extraction_provider (BaseSchemaExtractionProvider): The schema extraction provider.
         model (BaseChatModel): The language model for schema extraction.
         notes_app (BaseNotesApp): The notes application integration.
-        _url (Optional[str]): The current recipe URL being processed.
-        documents (Optional[list[Document]]): The scraped documents from the current URL.
-        extracted_schema (Optional[Recipe]): The extracted recipe schema.
+        cache (Optional[RecipeCache]): The cache of scraped documents and extracted recipes, if enabled.
     """
-    logger: logging.Logger
+    __slots__ = ("scraper", "schema_extraction_provider", "model", "notes_app", "cache")
     scraper: BaseScraper
     schema_extraction_provider: BaseSchemaExtractionProvider
     model: BaseChatModel
     notes_app: BaseNotesApp
-    _url: Optional[str]
-    documents: Optional[list[Document]]
-    extracted_schema: Optional[Recipe]
+    cache: Optional[RecipeCache]
 
     def __init__(
-        self, scraper: BaseScraper, schema_extraction_provider: BaseSchemaExtractionProvider, notes_app: BaseNotesApp
+        self,
+        scraper: BaseScraper,
+        schema_extraction_provider: BaseSchemaExtractionProvider,
+        notes_app: BaseNotesApp,
+        cache: Optional[RecipeCache] = None
     ) -> None:
         """Initialize the RecipeToNote orchestrator.
         
@@ -42,85 +50,220 @@ class RecipeToNote:
             scraper (BaseScraper): The web scraper implementation to use for content extraction.
             schema_extraction_provider (BaseSchemaExtractionProvider): The provider for language model access.
             notes_app (BaseNotesApp): The notes application integration for creating notes.
+            cache (Optional[RecipeCache]): The cache of scraped documents and extracted recipes.
+                If None, every URL is scraped and extracted again on each run.
         """
         self.scraper = scraper
         self.schema_extraction_provider = schema_extraction_provider
         self.model = self.schema_extraction_provider.get_model()
         self.notes_app = notes_app
+        self.cache = cache
 
         setup_logging()
-        self.logger = logging.getLogger(__name__)
 
-    def url(self, url: str) -> None:
-        """Set the URL of the recipe to process.
+    async def __aenter__(self) -> "RecipeToNote":
+        """Enter the runner context.
         
-        Args:
-            url (str): The URL of the recipe website to scrape and convert.
+        Returns:
+            RecipeToNote: This runner instance.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Exit the runner context, releasing resources held by the plugins."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release resources held by the plugins, such as HTTP connection pools.
+        
+        Plugins keep their HTTP clients open between runs to reuse connections,
+        so this should be called once the runner is no longer needed.
         """
-        self._url = url
+        await asyncio.gather(self.scraper.aclose(), self.notes_app.aclose())
 
-    async def scrape(self) -> None:
-        """Scrape content from the configured URL.
+    async def scrape(self, url: str, force: bool = False) -> list[Document]:
+        """Scrape content from a URL, reusing cached documents if available.
         
         Uses the configured scraper to extract content from the recipe website.
-        The scraped documents are stored in the instance for later processing.
+        
+        Args:
+            url (str): The URL of the recipe website to scrape.
+            force (bool): If True, scrape the website even if cached documents are available.
+            
+        Returns:
+            list[Document]: The scraped documents.
         """
-        self.documents = await self.scraper.scrape(self._url)
+        if self.cache is not None and not force:
+            documents = self.cache.get_documents(url)
+            if documents is not None:
+                logger.info("Using cached content of %s", url)
+                return documents
+        documents = await self.scraper.scrape(url)
+        # Scrapers return no documents on failure, which must not be cached
+        if self.cache is not None and documents:
+            self.cache.set_documents(url, documents)
+        return documents
 
-    async def extract_schema(self) -> None:
-        """Extract structured recipe data from scraped documents.
+    async def extract_schema(self, url: str, documents: list[Document], force: bool = False) -> Optional[Recipe]:
+        """Extract structured recipe data from scraped documents, reusing cached recipe if available.
         
         Uses the configured language model to parse the scraped content
         and extract structured recipe information.
+        
+        Args:
+            url (str): The URL of the recipe website the documents were scraped from.
+            documents (list[Document]): The documents scraped from the URL, exactly one is expected.
+            force (bool): If True, extract the recipe even if a cached recipe is available.
+            
+        Returns:
+            Optional[Recipe]: The extracted recipe, or None if extraction fails.
+            
+        Raises:
+            ValueError: If no documents are provided or more than one document is provided.
         """
-        self.extracted_schema = await extract_schema(self.model, self.documents)
+        if len(documents) == 0:
+            raise ValueError("No documents provided")
+        elif len(documents) > 1:
+            raise ValueError("Multiple documents provided, expected exactly one")
+
+        if self.cache is not None and not force:
+            recipe = self.cache.get_recipe(url, documents)
+            if recipe is not None:
+                logger.info("Using cached recipe of %s", url)
+                return recipe
+        recipe = await extract_schema(self.model, documents[0])
+        if self.cache is not None and recipe is not None:
+            self.cache.set_recipe(url, documents, recipe)
+        return recipe
 
-    async def create_note(self) -> None:
+    async def create_note(self, url: str, recipe: Recipe) -> Any:
         """Create a note from the extracted recipe data.
         
         Enriches the extracted recipe with URL metadata and creates
         a note in the configured notes application.
+        
+        Args:
+            url (str): The URL of the recipe website the recipe was extracted from.
+            recipe (Recipe): The extracted recipe.
+            
+        Returns:
+            Any: The result of the notes application, e.g. the created note.
         """
-        enriched_recipe = EnrichedRecipe(
-            **self.extracted_schema.model_dump(),
-            url=self._url,
-            domain=self._url.split('/')[2]
-        )
-        await self.notes_app.create_note(enriched_recipe)
+        enriched_recipe = EnrichedRecipe.from_recipe(recipe, url=url, domain=_get_domain(url))
+        return await self.notes_app.create_note(enriched_recipe)
 
-    async def run(self) -> None:
-        """Execute the complete recipe-to-note conversion pipeline.
+    async def run(self, url: str, force: bool = False) -> Any:
+        """Execute the complete recipe-to-note conversion pipeline for a URL.
         
         Runs the full pipeline: scraping, schema extraction, and note creation.
-        The URL must be set using the url() method before calling this method.
+        The notes application connects while the website is being scraped. If either
+        of them fails, the other one is cancelled.
+        
+        Args:
+            url (str): The URL of the recipe website to scrape and convert.
+            force (bool): If True, scrape and extract the recipe even if cached results are available.
+            
+        Returns:
+            Any: The result of note creation, e.g. the created note.
+            
+        Raises:
+            ValueError: If no recipe could be extracted from the URL.
         """
-        await self.scrape()
-        await self.extract_schema()
-        await self.create_note()
+        try:
+            async with asyncio.TaskGroup() as group:
+                scrape_task = group.create_task(self.scrape(url, force))
+                group.create_task(self.notes_app.connect())
+        except ExceptionGroup as e:
+            # Raise the original error rather than the group, as callers expect
+            raise e.exceptions[0]
+        documents = scrape_task.result()
+        recipe = await self.extract_schema(url, documents, force)
+        if recipe is None:
+            raise ValueError(f"No recipe extracted from {url}")
+        return await self.create_note(url, recipe)
+
+    async def run_many(self, urls: list[str], concurrency: int = 5, force: bool = False) -> list:
+        """Execute the recipe-to-note conversion pipeline for multiple URLs concurrently.
+        
+        Up to concurrency URLs are processed at the same time, each going through scraping,
+        schema extraction, and note creation. Existing notes are prefetched by the notes
+        application while the first websites are being scraped. A failure to process a URL
+        is logged and does not stop processing of the remaining URLs.
+        
+        Args:
+            urls (list[str]): The URLs of the recipe websites to scrape and convert.
+            concurrency (int): Maximum number of URLs processed at the same time.
+            force (bool): If True, scrape and extract recipes even if cached results are available.
+            
+        Returns:
+            list: Results of note creation for each URL, in the same order as urls.
+                URLs that failed are represented by the raised exception.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process(url: str):
+            async with semaphore:
+                return await self.run(url, force)
+
+        async def prefetch() -> None:
+            if len(urls) < 2:
+                return
+            try:
+                await self.notes_app.prefetch()
+            except Exception as e:
+                logger.warning("Failed to prefetch notes: %s", e)
+
+        results, _ = await asyncio.gather(
+            asyncio.gather(*(process(url) for url in urls), return_exceptions=True),
+            prefetch()
+        )
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to process %s: %s", url, result)
+        return results
+
+
+@lru_cache(maxsize=256)
+def _get_domain(url: str) -> str:
+    """Get the domain of a URL.
+    
+    The port and credentials, if present in the URL, are not included.
+    Results are cached, as the same URLs are processed repeatedly.
+    
+    Args:
+        url (str): The URL to get the domain of.
+        
+    Returns:
+        str: The lowercase host name of the URL, or empty string if the URL has none.
+    """
+    return urlparse(url).hostname or ""
 
 
 def setup_logging() -> None:
     """Configure logging for the application.
     
     Sets up logging with a consistent format and configurable log level.
-    The log level can be controlled via the LOG_LEVEL environment variable.
-    If not set or invalid, defaults to INFO level.
+    The log level can be controlled via the LOG_LEVEL environment variable, either
+    by name (case-insensitive) or numeric value. If not set or invalid, defaults
+    to INFO level. Logging is configured only once, subsequent calls have no effect.
     """
-    if os.getenv("LOG_LEVEL") is not None:
-        try:
-            log_level = getattr(logging, os.getenv("LOG_LEVEL"))
-        except AttributeError:
-            log_level = logging.INFO
+    global _LOGGING_READY
+    if _LOGGING_READY:
+        return
+    _LOGGING_READY = True
+
+    log_level = os.getenv("LOG_LEVEL", "")
+    if log_level.isdigit():
+        log_level = int(log_level)
     else:
-        log_level = logging.INFO
+        log_level = logging.getLevelNamesMapping().get(log_level.upper(), logging.INFO)
     # Set up logging on root logger level
-    logging.basicConfig(level=log_level)
     formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     handler = logging.StreamHandler()
     handler.setFormatter(formatter)
-    # Remove all handlers
+    # Remove all handlers of the root logger, leaving handlers of other loggers intact
     if root_logger.hasHandlers():
         root_logger.handlers.clear()
     root_logger.addHandler(handler)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
 
@@ -16,6 +16,8 @@ class Recipe(BaseModel):
         hints (Optional[str]): Additional tips or suggestions for the recipe.
         image_url (Optional[str]): URL of the main recipe image if available.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: Optional[str] = Field(
         default=None,
         description="The exact title/name of the recipe as it appears on the website. Do not modify or guess."
@@ -58,4 +60,22 @@ class EnrichedRecipe(Recipe):
     domain: str = Field(
         description="The domain of the recipe website."
     )
-    
\ No newline at end of file
+
+    @classmethod
+    def from_recipe(cls, recipe: Recipe, url: str, domain: str) -> "EnrichedRecipe":
+        """Create an enriched recipe from an already validated recipe.
+        
+        Fields are copied without running validation again, and field values such as
+        lists are shared with the source recipe rather than deep-copied. Only use it with
+        a Recipe that was validated before (e.g. parsed from the language model output),
+        and with url and domain of the correct type, as invalid data is not detected.
+        
+        Args:
+            recipe (Recipe): The validated recipe to enrich.
+            url (str): The URL of the recipe website.
+            domain (str): The domain of the recipe website.
+            
+        Returns:
+            EnrichedRecipe: The recipe enriched with the source website metadata.
+        """
+        return cls.model_construct(**recipe.__dict__, url=url, domain=domain)
@@ -2,52 +2,88 @@ from recipes_to_notes.schema import Recipe
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.documents.base import Document
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
 from typing import Optional
 import logging
+import re
+
+logger = logging.getLogger(__name__)
 
 SYSTEM_PROMPT: str = """
-You are a precise recipe extraction assistant. Your task is to extract cooking recipe information from scraped website content and return it in the specified structured format.
+You are a precise recipe extraction assistant. Extract the cooking recipe from scraped website content into the specified structured format.
 
-CRITICAL EXTRACTION RULES:
-1. IGNORE ALL BOILERPLATE: Skip navigation menus, headers, footers, advertisements, social media links, related articles, comments, author bios, and any non-recipe content.
+Rules:
+1. Use only recipe content. Ignore navigation, headers, footers, ads, social media links, related articles, comments and author bios.
+2. Copy text literally. Do not rephrase, convert units, standardize formatting, correct spelling or add missing information.
+3. Do not guess. Leave fields empty if the information is not explicitly present. Never use placeholders or combine partial information.
+4. Keep each ingredient and each instruction step as a separate list item, including quantities and details as written.
+5. Make sure ingredients are real ingredients, instructions are cooking steps rather than website instructions, and the image URL is an actual recipe photo.
 
-2. EXTRACT LITERALLY: Copy recipe information exactly as written. Do not:
-   - Rephrase or rewrite instructions
-   - Convert measurements or units
-   - Standardize formatting
-   - Correct grammar or spelling
-   - Add missing information
+When in doubt, omit the information rather than guess.
+"""
 
-3. NO GUESSING: If information is not explicitly provided in the content:
-   - Leave the field as null/empty
-   - Do not infer or estimate values
-   - Do not use placeholder text
-   - Do not combine partial information to create complete entries
+# Markdown links, except images and links wrapping other links or images. Link targets
+# can contain one level of balanced parentheses, e.g. https://en.wikipedia.org/wiki/Tart_(pastry)
+_LINK_PATTERN: re.Pattern = re.compile(r"(?<!!)\[([^\[\]]*)\]\((?:[^()]|\([^()]*\))*\)")
+# Runs of horizontal whitespace after the start of a line's text, keeping indentation of nested lists,
+# and whitespace at the end of a line
+_SPACES_PATTERN: re.Pattern = re.compile(r"(?<=\S)[ \t]+")
+_TRAILING_SPACES_PATTERN: re.Pattern = re.compile(r" $", re.MULTILINE)
+# More than one blank line, including whitespace-only lines
+_BLANK_LINES_PATTERN: re.Pattern = re.compile(r"\n\s*\n")
+# Extraction prompt, built once as it doesn't depend on the model or the document
+_PROMPT: ChatPromptTemplate = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_PROMPT),
+    ("user", "{document}"),
+])
+# Extraction chains keyed by id of the model they were built for, along with the model
+# itself, so the id is not reused by another model while the entry exists
+_CHAINS: dict[int, tuple[BaseChatModel, Runnable]] = {}
 
-4. FOCUS ON RECIPE CONTENT ONLY: Look for:
-   - Recipe title/name (usually in headings)
-   - Ingredient lists (with exact quantities and descriptions)
-   - Step-by-step cooking instructions
-   - Cooking times, temperatures
-   - Suggestions and/or hints
-   - Recipe images (actual URLs, not placeholders)
 
-5. PRESERVE ORIGINAL FORMAT: 
-   - Keep ingredients as separate list items exactly as listed
-   - Maintain instruction steps as separate items
-   - Preserve original wording and punctuation
-   - Include quantities, measurements, and descriptive details as written
+def compact_markdown(content: str) -> str:
+    """Reduce the size of scraped markdown content without losing recipe information.
+    
+    Targets of text links (mostly navigation, ads and related articles) are removed,
+    keeping only the link text. Image links are kept, as they are the source of
+    the recipe image URL. Whitespace runs within lines and blank lines are collapsed,
+    while indentation is kept, as it conveys the structure of nested lists.
+    Fewer input tokens make schema extraction faster and cheaper.
+    
+    Args:
+        content (str): The scraped markdown content.
+        
+    Returns:
+        str: The compacted markdown content.
+    """
+    content = _LINK_PATTERN.sub(r"\1", content)
+    content = _SPACES_PATTERN.sub(" ", content)
+    content = _TRAILING_SPACES_PATTERN.sub("", content)
+    content = _BLANK_LINES_PATTERN.sub("\n\n", content)
+    return content.strip()
 
-6. QUALITY CHECKS:
-   - Ensure extracted content is actually recipe-related
-   - Verify ingredient lists contain real ingredients, not navigation items
-   - Confirm instructions are cooking steps, not website instructions
-   - Only include image URLs that are actual recipe photos
 
-Extract only what is clearly present and recipe-specific. When in doubt, omit the information rather than guess.
-"""
+def _get_chain(model: BaseChatModel) -> Runnable:
+    """Get the extraction chain for a model, building it on first use.
+    
+    Binding the structured output schema derives the JSON schema from the Recipe model,
+    so it is done once per model instead of once per extraction.
+    
+    Args:
+        model (BaseChatModel): The language model to use for extraction.
+        
+    Returns:
+        Runnable: The chain of the extraction prompt and the model, returning a dict with
+            the raw model response under "raw", the Recipe object under "parsed" and
+            the parsing error, if any, under "parsing_error".
+    """
+    if id(model) not in _CHAINS:
+        extraction_model = model.with_structured_output(schema=Recipe, method="json_schema", include_raw=True)
+        _CHAINS[id(model)] = (model, _PROMPT | extraction_model)
+    return _CHAINS[id(model)][1]
+
 
-async def extract_schema(model: BaseChatModel, documents: list[Document]) -> Optional[Recipe]:
+async def extract_schema(model: BaseChatModel, document: Document) -> Optional[Recipe]:
     """Extract structured recipe data from unstructured document content.
     
     Uses a language model to parse scraped website content and extract
@@ -55,36 +91,27 @@ async def extract_schema(model: BaseChatModel, documents: list[Document]) -> Opt
     
     Args:
         model (BaseChatModel): The language model to use for extraction.
-        documents (list[Document]): List containing exactly one Document with scraped content.
+        document (Document): The Document with scraped content.
         
     Returns:
         Optional[Recipe]: A Recipe object with extracted data, or None if extraction fails.
-        
-    Raises:
-        ValueError: If no documents are provided or more than one document is provided.
     """
-    logger = logging.getLogger(__name__)
-    if len(documents) == 0:
-        raise ValueError("No documents provided")
-    elif len(documents) > 1:
-        raise ValueError("Multiple documents provided, expected exactly one")
-
-    document = documents[0].page_content
-    
-    extraction_model = model.with_structured_output(schema=Recipe, method="json_schema")
-    
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", SYSTEM_PROMPT),
-        ("user", "{document}"),
-    ])
-    
-    chain = prompt | extraction_model
+    original_url = document.metadata.get('original_url')
+    content = compact_markdown(document.page_content)
+    chain = _get_chain(model)
     
     try:
-        logger.info(f"Extracting schema from {documents[0].metadata['original_url']}")
-        recipe = await chain.ainvoke({"document": document})
-        logger.info(f"Extracted schema from {documents[0].metadata['original_url']}")
-        return recipe
+        logger.info("Extracting schema from %s", original_url)
+        result = await chain.ainvoke({"document": content})
+        if result["parsing_error"] is not None:
+            raise result["parsing_error"]
+        usage = result["raw"].usage_metadata or {}
+        logger.debug(
+            "Extraction used %s input tokens, %s of them read from prompt cache",
+            usage.get("input_tokens"), usage.get("input_token_details", {}).get("cache_read", 0)
+        )
+        logger.info("Extracted schema from %s", original_url)
+        return result["parsed"]
     except Exception as e:
-        logger.error(f"Error extracting schema from {documents[0].metadata['original_url']}: {e}")
+        logger.error("Error extracting schema from %s: %s", original_url, e)
         return None
\ No newline at end of file